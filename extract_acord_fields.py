@@ -6,15 +6,25 @@ Extracts field names from ACORD PDF forms using OCR
 
 import sys
 import os
+import ctypes
 import re
-from typing import List, Set
+import hashlib
+import json
+import multiprocessing
+import multiprocessing.pool
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 import argparse
 from pathlib import Path
 
+# Tesseract's LSTM uses several OpenMP threads per page, which oversubscribes
+# the CPU when one worker per core is already running. OpenMP reads this when
+# the library is loaded, so it must be set before tesserocr is imported.
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
 try:
-    from pdf2image import convert_from_path
-    import pytesseract
-    from PIL import Image
+    import pypdfium2 as pdfium
+    import pypdfium2.raw as pdfium_c
+    from tesserocr import OEM, PSM, RIL, PyTessBaseAPI, iterate_level
     import cv2
     import numpy as np
 except ImportError as e:
@@ -22,18 +32,216 @@ except ImportError as e:
     print("Please install dependencies: pip install -r requirements.txt")
     sys.exit(1)
 
+# An OCR'd word and its bounding box: (text, left, top, right, bottom)
+Word = Tuple[str, int, int, int, int]
+
+# Field name patterns, fused into a single regex so each line is matched
+# once. The alternatives are tried in priority order (colon, numbered) and
+# the named group that matched identifies which one it was. The regex is
+# only run on lines that pass a cheap substring/character test for at
+# least one of the alternatives. Fill-in-the-blank fields are found from
+# the word layout instead (see identify_gap_labels).
+_FIELD_RE = re.compile(
+    r'^(?:'
+    r'(?P<colon>[A-Z][A-Za-z\s&/\-,()]+):\s*$'
+    r'|\d+\.\s+(?P<numbered>[A-Z][A-Za-z\s&/\-,()]+)(?::|$)'
+    r')'
+)
+
+# Checkbox fields are matched last and separately, only on lines that start
+# with one of the glyphs, so the Unicode character set is never tried on
+# the vast majority of lines
+_CHECKBOX_RE = re.compile(r'^[☐□○◯O]\s+(?P<checkbox>[A-Z][A-Za-z\s&/\-,()]+)')
+_CHECKBOX_CHARS = frozenset('☐□○◯O')
+
+# Text that may form a field label
+_LABEL_RE = re.compile(r'[A-Z][A-Za-z\s&/\-,()]+')
+
+# Horizontal blank space wider than this many line heights separates a
+# label from the field it names
+_MIN_GAP_HEIGHTS = 3
+
+
+def _is_ocr_pages(data) -> bool:
+    """
+    Check that data loaded from the OCR cache has the shape ocr_document returns
+
+    Args:
+        data: Decoded JSON
+
+    Returns:
+        True if data is a list of pages, each a list of non-empty lines of
+        [text, left, top, right, bottom] words
+    """
+    return isinstance(data, list) and all(
+        isinstance(page, list) and all(
+            isinstance(line, list) and line and all(
+                isinstance(word, list) and len(word) == 5 and isinstance(word[0], str)
+                and all(isinstance(value, int) for value in word[1:])
+                for word in line
+            )
+            for line in page
+        )
+        for page in data
+    )
+
+
+# Pages whose mean Tesseract word confidence falls below this are OCR'd
+# again at _ESCALATION_DPI. Most ACORD text is legible at 200 DPI, so only
+# hard pages pay for the extra pixels.
+_MIN_CONFIDENCE = 60
+_ESCALATION_DPI = 300
+
+# Pages whose estimated glyph height exceeds _MAX_TEXT_HEIGHT pixels are
+# downscaled to _TARGET_TEXT_HEIGHT before preprocessing and OCR
+_MAX_TEXT_HEIGHT = 40
+_TARGET_TEXT_HEIGHT = 30
+
+# OCR results are cached here between runs. Bump _PREPROC_VERSION whenever
+# rendering, preprocessing or OCR changes so stale entries are not reused.
+# The directory is per user, so other local users cannot plant results.
+_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'acord_fields'
+_PREPROC_VERSION = 3
+
+
+# Tesseract API handle for the current process, created on first use so
+# the model is loaded once per process rather than once per page
+_tess_api = None
+
+
+def _get_tess_api() -> PyTessBaseAPI:
+    """
+    Get the Tesseract API for the current process
+
+    Returns:
+        Tesseract API configured to read the page as a uniform block of text
+    """
+    global _tess_api
+    if _tess_api is None:
+        _tess_api = PyTessBaseAPI(psm=PSM.SINGLE_BLOCK, oem=OEM.DEFAULT)
+    return _tess_api
+
+
+# Open PDF documents for the current process, keyed by path, so each worker
+# opens the file once rather than once per page
+_pdf_cache: Dict[str, pdfium.PdfDocument] = {}
+
+
+def _open_pdf(pdf_path: str) -> pdfium.PdfDocument:
+    """
+    Get the open PDF document for the current process
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        Open PDFium document
+    """
+    pdf = _pdf_cache.get(pdf_path)
+    if pdf is None:
+        pdf = _pdf_cache[pdf_path] = pdfium.PdfDocument(pdf_path)
+    return pdf
+
+
+def _init_worker(pdf_path: str):
+    """
+    Initialize an OCR worker process by opening the PDF; the Tesseract model
+    is loaded on the worker's first page
+
+    Args:
+        pdf_path: Path to the PDF file
+    """
+    _open_pdf(pdf_path)
+
+
+def _render_page(pdf_path: str, page_number: int, dpi: int) -> np.ndarray:
+    """
+    Render a PDF page in-process with PDFium
+
+    Args:
+        pdf_path: Path to the PDF file
+        page_number: 1-based page number
+        dpi: DPI to render at
+
+    Returns:
+        RGB page image as a numpy array
+    """
+    page = _open_pdf(pdf_path)[page_number - 1]
+    try:
+        # PDF user space is 72 units per inch
+        return page.render(scale=dpi / 72, rev_byteorder=True).to_numpy()
+    finally:
+        # Release PDFium's parsed page now rather than at garbage collection;
+        # the bitmap's buffer is owned by Python and outlives the page
+        page.close()
+
+
+def _is_born_digital(pdf_path: str, page_number: int) -> bool:
+    """
+    Check whether a PDF page was generated digitally rather than scanned
+
+    A born-digital page draws its text as text objects. A scanned page is
+    one large image, possibly with an invisible OCR text layer over it.
+
+    Args:
+        pdf_path: Path to the PDF file
+        page_number: 1-based page number
+
+    Returns:
+        True if the page has text objects and no image covering more than
+        half of it
+    """
+    page = _open_pdf(pdf_path)[page_number - 1]
+    try:
+        width, height = page.get_size()
+        has_text = False
+        for obj in page.get_objects():
+            if obj.type == pdfium_c.FPDF_PAGEOBJ_TEXT:
+                has_text = True
+            elif obj.type == pdfium_c.FPDF_PAGEOBJ_IMAGE:
+                left, bottom, right, top = (ctypes.c_float() for _ in range(4))
+                pdfium_c.FPDFPageObj_GetBounds(obj.raw, left, bottom, right, top)
+                area = (right.value - left.value) * (top.value - bottom.value)
+                if area > 0.5 * width * height:
+                    return False
+        return has_text
+    finally:
+        page.close()
+
+
+def _ocr_page(task: Tuple[str, int, int]) -> Tuple[int, List[List[Word]], Optional[float]]:
+    """
+    Render, preprocess and OCR a single page (runs in a worker process)
+
+    Args:
+        task: Tuple of (PDF path, 1-based page number, DPI)
+
+    Returns:
+        Tuple of (page number, words grouped by line, mean word confidence
+        or None if no words were found)
+    """
+    pdf_path, page_number, dpi = task
+    born_digital = _is_born_digital(pdf_path, page_number)
+    # Pass the page image straight through so extract_text_from_image holds
+    # the only reference and can free it once it has been preprocessed
+    return (page_number, *ACORDFieldExtractor.extract_text_from_image(
+        _render_page(pdf_path, page_number, dpi), born_digital, dpi))
+
 
 class ACORDFieldExtractor:
     """Extract field names from ACORD forms using OCR"""
 
-    def __init__(self, pdf_path: str, output_path: str = None, dpi: int = 300):
+    def __init__(self, pdf_path: str, output_path: str = None, dpi: int = 200,
+                 use_cache: bool = True):
         """
         Initialize the ACORD field extractor
 
         Args:
             pdf_path: Path to the PDF file
             output_path: Path to save the output text file (default: same name as PDF with .txt extension)
-            dpi: DPI for PDF to image conversion (higher = better quality but slower)
+            dpi: DPI for PDF to image conversion (higher = better quality but slower);
+                 low-confidence pages are retried at 300 DPI
+            use_cache: Reuse OCR results from a previous run on the same PDF and DPI
         """
         self.pdf_path = Path(pdf_path)
         if not self.pdf_path.exists():
@@ -45,54 +253,135 @@ class ACORDFieldExtractor:
             self.output_path = self.pdf_path.with_suffix('.txt')
 
         self.dpi = dpi
-        self.field_names: Set[str] = set()
+        self.use_cache = use_cache
+        # Field names found on each page, deduplicated once at the end
+        self._field_lists: List[List[str]] = []
 
-    def preprocess_image(self, image: Image.Image) -> Image.Image:
+    @property
+    def field_names(self) -> Set[str]:
+        """Unique field names found so far"""
+        return set().union(*self._field_lists)
+
+    @staticmethod
+    def estimate_text_height(gray: np.ndarray) -> float:
         """
-        Preprocess image to improve OCR accuracy
+        Estimate the typical glyph height of the text on a page
 
         Args:
-            image: PIL Image object
+            gray: Grayscale image as a uint8 numpy array
 
         Returns:
-            Preprocessed PIL Image
+            Median height in pixels of character-sized connected components,
+            or 0 if none are found
         """
-        # Convert to numpy array
-        img_array = np.array(image)
+        # Work at half size; the estimate only needs to be roughly right
+        small = cv2.resize(gray, None, fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA)
+        _, binary = cv2.threshold(small, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+        _, _, stats, _ = cv2.connectedComponentsWithStats(binary, connectivity=8)
+
+        # Skip the background label, specks, and table rules or boxes
+        heights = stats[1:, cv2.CC_STAT_HEIGHT]
+        widths = stats[1:, cv2.CC_STAT_WIDTH]
+        glyphs = heights[(heights > 1) & (heights < small.shape[0] // 20) & (widths < 3 * heights)]
+        if glyphs.size == 0:
+            return 0.0
+
+        return 2 * float(np.median(glyphs))
+
+    @staticmethod
+    def preprocess_image(img_array: np.ndarray, born_digital: bool = False) -> np.ndarray:
+        """
+        Preprocess image to improve OCR accuracy
 
+        Args:
+            img_array: RGB or grayscale image as a numpy array
+            born_digital: Whether the page was generated digitally rather than
+                          scanned; such pages skip thresholding
+
+        Returns:
+            Preprocessed grayscale image as a uint8 numpy array
+        """
         # Convert to grayscale
         if len(img_array.shape) == 3:
             gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
         else:
             gray = img_array
 
-        # Apply thresholding to get better contrast
-        _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-
-        # Denoise
-        denoised = cv2.fastNlMeansDenoising(thresh, None, 10, 7, 21)
+        # Shrink oversampled pages; Tesseract gains nothing from glyphs much
+        # taller than it was trained on, and every later step scales with
+        # the number of pixels
+        text_height = ACORDFieldExtractor.estimate_text_height(gray)
+        if text_height > _MAX_TEXT_HEIGHT:
+            scale = _TARGET_TEXT_HEIGHT / text_height
+            gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+        # Born-digital pages render clean, so they go to Tesseract as they
+        # are; it binarizes internally
+        if born_digital:
+            return gray
+
+        # Binarize against the local mean over a 31x31 window rather than a
+        # single global threshold, so uneven lighting in scans doesn't wash
+        # out or blacken parts of the page
+        thresh = cv2.adaptiveThreshold(
+            gray, 255, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY, 31, 10
+        )
 
-        # Convert back to PIL Image
-        return Image.fromarray(denoised)
+        return thresh
 
-    def extract_text_from_image(self, image: Image.Image) -> str:
+    @staticmethod
+    def extract_text_from_image(image: np.ndarray, born_digital: bool = False,
+                                dpi: Optional[int] = None) -> Tuple[List[List[Word]], Optional[float]]:
         """
-        Extract text from image using Tesseract OCR
+        Extract words and their positions from image using Tesseract OCR
 
         Args:
-            image: PIL Image object
+            image: RGB or grayscale image as a numpy array
+            born_digital: Whether the page was generated digitally rather than scanned
+            dpi: DPI the image was rendered at, if known
 
         Returns:
-            Extracted text as string
+            Tuple of (words grouped by text line, mean word confidence from 0 to 100
+            or None if no words were found)
         """
-        # Preprocess the image
-        preprocessed = self.preprocess_image(image)
-
-        # Use Tesseract to extract text
-        custom_config = r'--oem 3 --psm 6'  # PSM 6: Assume uniform block of text
-        text = pytesseract.image_to_string(preprocessed, config=custom_config)
-
-        return text
+        # Preprocess the image, then drop the full-color page so it is freed
+        # before OCR rather than held for the whole call
+        rendered_width = image.shape[1]
+        preprocessed = ACORDFieldExtractor.preprocess_image(image, born_digital)
+        del image
+
+        # Run Tesseract in-process on the raw 8-bit grayscale buffer
+        height, width = preprocessed.shape
+        api = _get_tess_api()
+        api.SetImageBytes(preprocessed.tobytes(), width, height, 1, width)
+        # Tesseract holds its own copy of the pixels from here on
+        del preprocessed
+        # Tell Tesseract the real resolution, allowing for any downscaling,
+        # instead of leaving it to guess from its 70 DPI default
+        if dpi:
+            api.SetSourceResolution(round(dpi * width / rendered_width))
+        api.Recognize()
+
+        # Collect each word with its bounding box, starting a new list at
+        # the beginning of every text line
+        lines = []
+        confidences = []
+        iterator = api.GetIterator()
+        if iterator is not None:
+            for word in iterate_level(iterator, RIL.WORD):
+                if word.IsAtBeginningOf(RIL.TEXTLINE) or not lines:
+                    lines.append([])
+                text = word.GetUTF8Text(RIL.WORD)
+                if not text:
+                    continue
+                lines[-1].append((text, *word.BoundingBox(RIL.WORD)))
+                confidences.append(word.Confidence(RIL.WORD))
+
+        # A blank page has no confidence to speak of; report None rather
+        # than 0 so it is not mistaken for a poor scan and re-OCR'd
+        mean_confidence = float(np.mean(confidences)) if confidences else None
+
+        return [line for line in lines if line], mean_confidence
 
     def identify_field_names(self, text: str) -> List[str]:
         """
@@ -100,7 +389,6 @@ class ACORDFieldExtractor:
 
         ACORD forms typically have fields in these patterns:
         - "Field Name:" (colon-based)
-        - "Field Name ___" (underscore-based)
         - "1. Field Name" (numbered)
         - "☐ Field Name" or "□ Field Name" (checkbox-based)
 
@@ -111,112 +399,232 @@ class ACORDFieldExtractor:
             List of identified field names
         """
         field_names = []
-        lines = text.split('\n')
+        lines = [s for s in (l.strip() for l in text.splitlines()) if s]
 
         for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            # Pattern 1: Field names ending with colon
-            # e.g., "Named Insured:", "Policy Number:", "Effective Date:"
-            colon_pattern = r'^([A-Z][A-Za-z\s&/\-,()]+):\s*$'
-            match = re.search(colon_pattern, line)
-            if match:
-                field_name = match.group(1).strip()
-                if len(field_name) > 3 and len(field_name) < 100:  # Filter out noise
-                    field_names.append(field_name)
-                continue
-
-            # Pattern 2: Field names with underscores (fill-in-the-blank style)
-            # e.g., "Name ________", "Address _______"
-            underscore_pattern = r'^([A-Z][A-Za-z\s&/\-,()]+)\s+_{2,}'
-            match = re.search(underscore_pattern, line)
-            if match:
-                field_name = match.group(1).strip()
-                if len(field_name) > 3 and len(field_name) < 100:
-                    field_names.append(field_name)
-                continue
-
-            # Pattern 3: Numbered fields
-            # e.g., "1. Policy Holder", "2. Coverage Type"
-            numbered_pattern = r'^\d+\.\s+([A-Z][A-Za-z\s&/\-,()]+)(?::|$)'
-            match = re.search(numbered_pattern, line)
+            # Patterns 1-3:
+            # - "Named Insured:", "Policy Number:" (colon)
+            # - "1. Policy Holder", "2. Coverage Type" (numbered)
+            # - "☐ Yes", "□ No", "O Option" (checkbox)
+            match = None
+            if ':' in line or line[0].isdigit():
+                match = _FIELD_RE.match(line)
+            if match is None and line[0] in _CHECKBOX_CHARS:
+                match = _CHECKBOX_RE.match(line)
             if match:
-                field_name = match.group(1).strip()
-                if len(field_name) > 3 and len(field_name) < 100:
+                field_name = match.group(match.lastgroup).strip()
+                # Checkbox options are often short ("Yes", "No")
+                min_length = 2 if match.lastgroup == 'checkbox' else 3
+                if min_length < len(field_name) < 100:  # Filter out noise
                     field_names.append(field_name)
                 continue
 
-            # Pattern 4: Checkbox fields
-            # e.g., "☐ Yes", "□ No", "O Option"
-            checkbox_pattern = r'^[☐□○◯O]\s+([A-Z][A-Za-z\s&/\-,()]+)'
-            match = re.search(checkbox_pattern, line)
-            if match:
-                field_name = match.group(1).strip()
-                if len(field_name) > 2 and len(field_name) < 100:
-                    field_names.append(field_name)
-                continue
-
-            # Pattern 5: Label-like patterns (all caps or title case starting a line)
+            # Pattern 4: Label-like patterns (all caps or title case starting a line)
             # This is more lenient and catches other field labels
             if line and line[0].isupper() and ':' in line:
                 parts = line.split(':')
                 if len(parts) >= 2:
-                    field_name = parts[0].strip()
+                    # Stop at a fill-in underline, e.g. "Name ____ Date:" -> "Name"
+                    field_name = parts[0].split('__')[0].strip()
                     # Avoid sentences and long text
                     if len(field_name.split()) <= 8 and len(field_name) < 100:
                         field_names.append(field_name)
 
         return field_names
 
-    def extract_fields(self) -> Set[str]:
+    def identify_gap_labels(self, lines: List[List[Word]]) -> List[str]:
         """
-        Main method to extract all field names from the PDF
+        Identify field names from the layout of the OCR'd words
+
+        A fill-in field is a label followed by blank space on the same line:
+        either a wide horizontal gap before the next word, or an underline
+        that Tesseract reads as a run of underscores (e.g. "Name ________").
+
+        Args:
+            lines: OCR'd words with bounding boxes, grouped by text line
 
         Returns:
-            Set of unique field names
+            List of identified field names
+        """
+        # Runs of words that are followed by blank space
+        runs = []
+        for line in lines:
+            heights = sorted(bottom - top for _, _, top, _, bottom in line)
+            min_gap = _MIN_GAP_HEIGHTS * heights[len(heights) // 2]
+
+            run = []
+            prev_right = None
+            for text, left, _, right, _ in line:
+                # A wide gap ends the current run of words
+                if run and left - prev_right > min_gap:
+                    runs.append(run)
+                    run = []
+
+                word = text.rstrip('_')
+                if word:
+                    run.append(word)
+
+                # So does an underline, alone or attached to the last word
+                if run and text.endswith('__'):
+                    runs.append(run)
+                    run = []
+
+                prev_right = right
+
+        field_names = []
+        for run in runs:
+            field_name = ' '.join(run).rstrip(':').strip()
+            # Avoid sentences and long text
+            if (3 < len(field_name) < 100 and len(field_name.split()) <= 8
+                    and _LABEL_RE.fullmatch(field_name)):
+                field_names.append(field_name)
+
+        return field_names
+
+    def ocr_pages(self, pool: multiprocessing.pool.Pool, dpi: int,
+                  page_numbers: List[int]) -> Iterator[Tuple[int, List[List[Word]], Optional[float]]]:
+        """
+        OCR PDF pages on a worker pool
+
+        Args:
+            pool: Worker pool to run OCR on
+            dpi: DPI to render at
+            page_numbers: 1-based numbers of the pages to OCR
+
+        Yields:
+            Tuples of (page number, words grouped by line, mean word confidence
+            or None if no words were found), in completion order
+        """
+        # Workers render the pages themselves, so only the page's identity
+        # crosses the process boundary rather than its pixels
+        tasks = [(str(self.pdf_path), i, dpi) for i in page_numbers]
+        yield from pool.imap_unordered(_ocr_page, tasks, chunksize=1)
+
+    def ocr_document(self) -> List[List[List[Word]]]:
+        """
+        OCR every page of the PDF
+
+        Pages are OCR'd at the configured DPI first. Pages where Tesseract's
+        mean word confidence is low are OCR'd again at a higher DPI.
+
+        Returns:
+            OCR'd words grouped by text line, for each page in page order
         """
         print(f"Converting PDF to images (DPI: {self.dpi})...")
         try:
-            images = convert_from_path(str(self.pdf_path), dpi=self.dpi)
+            pdf = pdfium.PdfDocument(str(self.pdf_path))
+            page_count = len(pdf)
+            pdf.close()
         except Exception as e:
             print(f"Error converting PDF: {e}")
-            print("Note: Make sure poppler-utils is installed on your system")
             sys.exit(1)
 
-        print(f"Processing {len(images)} page(s)...")
+        if page_count == 0:
+            return []
 
-        for i, image in enumerate(images, 1):
-            print(f"  Processing page {i}/{len(images)}...")
+        # No point starting (and loading a model in) more workers than pages
+        workers = min(os.cpu_count() or 1, page_count)
+        print(f"Processing {page_count} page(s) on {workers} worker(s)...")
 
-            # Extract text from the image
-            text = self.extract_text_from_image(image)
+        pages = [[] for _ in range(page_count)]
+        with multiprocessing.Pool(processes=workers, initializer=_init_worker,
+                                  initargs=(str(self.pdf_path),)) as pool:
+            dpi = self.dpi
+            page_numbers = list(range(1, page_count + 1))
+            while page_numbers:
+                retry = []
+                for i, lines, confidence in self.ocr_pages(pool, dpi, page_numbers):
+                    if (confidence is not None and confidence < _MIN_CONFIDENCE
+                            and dpi < _ESCALATION_DPI):
+                        print(f"  Page {i}/{page_count}: low OCR confidence ({confidence:.0f}), "
+                              f"retrying at {_ESCALATION_DPI} DPI")
+                        retry.append(i)
+                        continue
 
-            # Identify field names
-            fields = self.identify_field_names(text)
+                    pages[i - 1] = lines
+                    print(f"  Page {i}/{page_count}: OCR complete")
 
-            # Add to the set (automatically handles duplicates)
-            self.field_names.update(fields)
+                dpi, page_numbers = _ESCALATION_DPI, retry
 
-            print(f"    Found {len(fields)} field(s) on page {i}")
+        return pages
+
+    def cache_path(self) -> Path:
+        """
+        Get the OCR cache file for this PDF and DPI
+
+        Returns:
+            Path of the cache file, keyed on the PDF contents, the DPI and
+            _PREPROC_VERSION
+        """
+        digest = hashlib.sha256(self.pdf_path.read_bytes()).hexdigest()
+        return _CACHE_DIR / f"{digest}_{self.dpi}_{_PREPROC_VERSION}.json"
+
+    def extract_fields(self) -> Set[str]:
+        """
+        Main method to extract all field names from the PDF
+
+        OCR results are cached on disk, so re-running on the same PDF only
+        repeats the field identification.
+
+        Returns:
+            Set of unique field names
+        """
+        pages = None
+        if self.use_cache:
+            cache_file = self.cache_path()
+            try:
+                pages = json.loads(cache_file.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                pages = None
+            if _is_ocr_pages(pages):
+                print(f"Using cached OCR results: {cache_file}")
+            else:
+                pages = None
+
+        if pages is None:
+            pages = self.ocr_document()
+            if self.use_cache:
+                # Write to a temporary file first so an interrupted run never
+                # leaves a truncated cache entry behind
+                tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+                try:
+                    _CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+                    tmp_file.write_text(json.dumps(pages), encoding='utf-8')
+                    os.replace(tmp_file, cache_file)
+                except OSError as e:
+                    # Don't leave a partial file behind, e.g. on a full disk
+                    try:
+                        tmp_file.unlink(missing_ok=True)
+                    except OSError:
+                        pass
+                    print(f"Warning: could not write OCR cache: {e}")
+
+        for i, lines in enumerate(pages, 1):
+            # Identify field names from the text and from the layout
+            text = '\n'.join(' '.join(word[0] for word in line) for line in lines)
+            fields = self.identify_field_names(text) + self.identify_gap_labels(lines)
+
+            self._field_lists.append(fields)
+
+            print(f"  Page {i}/{len(pages)}: found {len(fields)} field(s)")
 
         return self.field_names
 
     def save_results(self):
         """Save extracted field names to a text file"""
-        # Sort field names alphabetically
+        # Deduplicate and sort field names alphabetically
         sorted_fields = sorted(self.field_names)
 
-        with open(self.output_path, 'w', encoding='utf-8') as f:
-            f.write("ACORD Form Field Names\n")
-            f.write("=" * 50 + "\n")
-            f.write(f"Source: {self.pdf_path.name}\n")
-            f.write(f"Total Fields Found: {len(sorted_fields)}\n")
-            f.write("=" * 50 + "\n\n")
-
-            for i, field in enumerate(sorted_fields, 1):
-                f.write(f"{i}. {field}\n")
+        # Build the whole file in memory and write it in one call
+        header = (
+            "ACORD Form Field Names\n"
+            + "=" * 50 + "\n"
+            + f"Source: {self.pdf_path.name}\n"
+            + f"Total Fields Found: {len(sorted_fields)}\n"
+            + "=" * 50 + "\n\n"
+        )
+        body = "".join(f"{i}. {field}\n" for i, field in enumerate(sorted_fields, 1))
+        self.output_path.write_text(header + body, encoding='utf-8')
 
         print(f"\n✓ Results saved to: {self.output_path}")
         print(f"✓ Total unique fields found: {len(sorted_fields)}")
@@ -251,8 +659,15 @@ Examples:
     parser.add_argument(
         '--dpi',
         type=int,
-        default=300,
-        help='DPI for PDF to image conversion (default: 300, higher = better quality but slower)'
+        default=200,
+        help='DPI for PDF to image conversion (default: 200, higher = better quality but slower; '
+             'low-confidence pages are retried at 300)'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore and do not write cached OCR results from previous runs'
     )
 
     args = parser.parse_args()
@@ -262,7 +677,8 @@ Examples:
         extractor = ACORDFieldExtractor(
             pdf_path=args.pdf_file,
             output_path=args.output,
-            dpi=args.dpi
+            dpi=args.dpi,
+            use_cache=not args.no_cache
         )
 
         # Extract fields